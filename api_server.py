@@ -13,16 +13,15 @@ Endpoints:
 
 WebSocket protocol (ARB, compare):
   Client sends: {"type": "arb"|"compare", "limit": N, ...options}
-  Server sends: {"type": "progress", "msg": "..."} (multiple)
+  Server sends: {"type": "progress", "msgs": ["...", ...]} (multiple; bursts coalesced)
                {"type": "done",     "data": [...]}
             or {"type": "error",    "msg": "..."}
 """
 
 import asyncio
-import dataclasses
-import queue as sync_queue
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Callable
 
 # Ensure sibling modules (clients/, comparator.py, etc.) are importable
@@ -30,6 +29,9 @@ sys.path.insert(0, os.path.dirname(__file__))
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
+import orjson
 import uvicorn
 
 app = FastAPI(title="Prediction Market Terminal API", version="1.0.0")
@@ -40,30 +42,35 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Event lists and ARB/CMP payloads are large, repetitive JSON — compress them
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 # ── Serialization ──────────────────────────────────────────────────────────────
 
 
-def _serialize(obj: Any) -> Any:
-    """Recursively convert dataclasses / lists / dicts to JSON-safe types."""
-    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
-        return {k: _serialize(v) for k, v in dataclasses.asdict(obj).items()}
-    if isinstance(obj, list):
-        return [_serialize(i) for i in obj]
-    if isinstance(obj, dict):
-        return {k: _serialize(v) for k, v in obj.items()}
-    if isinstance(obj, tuple):
-        return [_serialize(i) for i in obj]
-    return obj
+def _dumps(obj: Any) -> bytes:
+    """Encode dataclasses / lists / dicts / tuples straight to JSON bytes.
+
+    orjson walks dataclass instances natively via their fields, so there is no
+    intermediate dict tree (and no dataclasses.asdict deep-copy) in between.
+    """
+    return orjson.dumps(obj)
+
+
+def _stream_json_list(items: list) -> StreamingResponse:
+    """Stream a JSON array one element at a time, so the full body is never held in memory."""
+    def chunks():
+        yield b"["
+        for i, item in enumerate(items):
+            yield (b"," if i else b"") + _dumps(item)
+        yield b"]"
+    return StreamingResponse(chunks(), media_type="application/json")
 
 
 def _serialize_compare(pairs: list) -> list:
-    """Serialize list[tuple[MatchResult, list[MarketMatchResult]]] → JSON."""
-    return [
-        {"event_match": _serialize(em), "market_matches": _serialize(mm)}
-        for em, mm in pairs
-    ]
+    """Reshape list[tuple[MatchResult, list[MarketMatchResult]]] for the UI."""
+    return [{"event_match": em, "market_matches": mm} for em, mm in pairs]
 
 
 # ── Date filter helper ─────────────────────────────────────────────────────────
@@ -94,18 +101,34 @@ def _filter_by_days(events: list, max_days: int | None) -> list:
 
 Progress = Callable[[str], None]
 
+# Progress messages arriving within this window of each other share one WS frame
+PROGRESS_COALESCE_S = 0.02
 
-def _run_arb(limit: int, progress: Progress, **kwargs) -> dict:
-    category = kwargs.pop("category", None)
-    progress("Fetching Polymarket events…")
-    from clients.polymarket import fetch_events as pm_fetch
-    pm_events = pm_fetch(limit=limit, category=category)
 
-    progress(f"Got {len(pm_events)} PM events. Fetching Kalshi…")
+def _fetch_both(limit: int, category: str | None, progress: Progress) -> tuple[list, list]:
+    """Fetch Polymarket and Kalshi events concurrently; wall time is the slower of the two."""
+    from clients.polymarket import fetch_events as pm_fetch
     from clients.kalshi import fetch_events as ks_fetch
-    ks_events = ks_fetch(limit=limit, category=category)
 
-    progress(f"Got {len(ks_events)} KS events. Running semantic matching…")
+    progress("Fetching Polymarket and Kalshi events…")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futures = {
+            ex.submit(pm_fetch, limit=limit, category=category): "PM",
+            ex.submit(ks_fetch, limit=limit, category=category): "KS",
+        }
+        fetched: dict[str, list] = {}
+        for fut in as_completed(futures):
+            label = futures[fut]
+            fetched[label] = fut.result()
+            progress(f"Got {len(fetched[label])} {label} events.")
+    return fetched["PM"], fetched["KS"]
+
+
+def _run_arb(limit: int, progress: Progress, **kwargs) -> dict:
+    category = kwargs.pop("category", None)
+    pm_events, ks_events = _fetch_both(limit, category, progress)
+
+    progress("Running semantic matching…")
     from comparator import find_market_matches, find_arbitrage
     pairs = find_market_matches(
         pm_events, ks_events,
@@ -128,18 +151,12 @@ def _run_arb(limit: int, progress: Progress, **kwargs) -> dict:
 def _run_compare(limit: int, progress: Progress, **kwargs) -> dict:
     category = kwargs.pop("category", None)
     max_days = kwargs.get("max_days")
-    progress("Fetching Polymarket events…")
-    from clients.polymarket import fetch_events as pm_fetch
-    pm_events = pm_fetch(limit=limit, category=category)
-
-    progress(f"Got {len(pm_events)} PM events. Fetching Kalshi…")
-    from clients.kalshi import fetch_events as ks_fetch
-    ks_events = ks_fetch(limit=limit, category=category)
+    pm_events, ks_events = _fetch_both(limit, category, progress)
 
     pm_events = _filter_by_days(pm_events, max_days)
     ks_events = _filter_by_days(ks_events, max_days)
 
-    progress(f"Got {len(ks_events)} KS events. Running semantic matching…")
+    progress(f"Got {len(pm_events)} PM / {len(ks_events)} KS events. Running semantic matching…")
     from comparator import find_market_matches
     pairs = find_market_matches(
         pm_events, ks_events,
@@ -159,9 +176,9 @@ def _run_compare(limit: int, progress: Progress, **kwargs) -> dict:
 def _transform_arb_done(raw: dict) -> dict:
     """Build the 'done' payload for an ARB run, including raw event lists."""
     return {
-        "data": _serialize(raw["results"]),
-        "pm_events": _serialize(raw["pm_events"]),
-        "ks_events": _serialize(raw["ks_events"]),
+        "data": raw["results"],
+        "pm_events": raw["pm_events"],
+        "ks_events": raw["ks_events"],
     }
 
 
@@ -169,8 +186,8 @@ def _transform_cmp_done(raw: dict) -> dict:
     """Build the 'done' payload for a CMP run, including raw event lists."""
     return {
         "data": _serialize_compare(raw["pairs"]),
-        "pm_events": _serialize(raw["pm_events"]),
-        "ks_events": _serialize(raw["ks_events"]),
+        "pm_events": raw["pm_events"],
+        "ks_events": raw["ks_events"],
     }
 
 
@@ -178,20 +195,23 @@ async def _stream_ws(websocket: WebSocket, sync_fn, *args, **kwargs):
     """
     Run sync_fn(*args, progress=cb, **kwargs) in a thread pool.
     Stream progress messages to websocket until done, then send result.
+    Messages emitted in quick succession are batched into one 'progress' frame.
 
     Optional kwargs (popped before forwarding to sync_fn):
       serialize_fn=fn   — custom serializer for the raw result
       transform_done=fn — takes raw result, returns dict merged into 'done' message
                           (overrides serialize_fn when provided)
     """
-    q: sync_queue.Queue = sync_queue.Queue()
+    loop = asyncio.get_running_loop()
+    q: asyncio.Queue = asyncio.Queue()
     result_holder: list = []
     error_holder: list = []
     serialize_fn = kwargs.pop("serialize_fn", None)
     transform_done = kwargs.pop("transform_done", None)
 
+    # sync_fn runs in a worker thread; hand messages to the event loop thread-safely
     def progress_cb(msg: str) -> None:
-        q.put(("progress", msg))
+        loop.call_soon_threadsafe(q.put_nowait, ("progress", msg))
 
     def run_sync() -> None:
         try:
@@ -200,19 +220,27 @@ async def _stream_ws(websocket: WebSocket, sync_fn, *args, **kwargs):
         except Exception as exc:
             error_holder.append(str(exc))
         finally:
-            q.put(("__done__", None))
+            loop.call_soon_threadsafe(q.put_nowait, ("__done__", None))
 
-    loop = asyncio.get_running_loop()
     future = loop.run_in_executor(None, run_sync)
 
-    while True:
-        try:
-            msg_type, msg_data = q.get_nowait()
+    done = False
+    while not done:
+        msg_type, msg_data = await q.get()
+        if msg_type == "__done__":
+            break
+        pending = [msg_data]
+        # Keep collecting until the worker goes quiet for PROGRESS_COALESCE_S
+        while True:
+            try:
+                msg_type, msg_data = await asyncio.wait_for(q.get(), PROGRESS_COALESCE_S)
+            except asyncio.TimeoutError:
+                break
             if msg_type == "__done__":
+                done = True
                 break
-            await websocket.send_json({"type": msg_type, "msg": msg_data})
-        except sync_queue.Empty:
-            await asyncio.sleep(0.05)
+            pending.append(msg_data)
+        await websocket.send_json({"type": "progress", "msgs": pending})
 
     await future  # propagate any unhandled exceptions
 
@@ -223,9 +251,10 @@ async def _stream_ws(websocket: WebSocket, sync_fn, *args, **kwargs):
         if transform_done:
             payload = {"type": "done", **transform_done(raw)}
         else:
-            data = serialize_fn(raw) if serialize_fn else _serialize(raw)
+            data = serialize_fn(raw) if serialize_fn else raw
             payload = {"type": "done", "data": data}
-        await websocket.send_json(payload)
+        # The UI parses text frames, so decode the orjson bytes rather than send_bytes
+        await websocket.send_text(_dumps(payload).decode())
 
 
 # ── REST endpoints ─────────────────────────────────────────────────────────────
@@ -244,7 +273,7 @@ async def get_polymarket_events(limit: int = 200, category: str | None = None, m
         return _filter_by_days(events, max_days)
     try:
         events = await asyncio.to_thread(fetch)
-        return _serialize(events)
+        return _stream_json_list(events)
     except Exception as exc:
         raise HTTPException(status_code=502, detail=str(exc))
 
@@ -257,7 +286,7 @@ async def get_kalshi_events(limit: int = 200, category: str | None = None, max_d
         return _filter_by_days(events, max_days)
     try:
         events = await asyncio.to_thread(fetch)
-        return _serialize(events)
+        return _stream_json_list(events)
     except Exception as exc:
         raise HTTPException(status_code=502, detail=str(exc))
 
@@ -266,11 +295,8 @@ async def get_kalshi_events(limit: int = 200, category: str | None = None, max_d
 async def get_categories():
     """Return unique normalized categories available on each platform."""
     def fetch():
-        from clients.polymarket import fetch_events as pm_fetch
-        from clients.kalshi import fetch_events as ks_fetch
         from comparator import normalize_category
-        pm_events = pm_fetch(limit=200)
-        ks_events = ks_fetch(limit=200)
+        pm_events, ks_events = _fetch_both(200, None, lambda _msg: None)
         pm_cats = sorted({normalize_category(e.category) for e in pm_events if e.category})
         ks_cats = sorted({normalize_category(e.category) for e in ks_events if e.category})
         return {"polymarket": pm_cats, "kalshi": ks_cats}
@@ -343,4 +369,5 @@ async def websocket_status(websocket: WebSocket):
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="127.0.0.1", port=8081, log_level="info")
+    # permessage-deflate compresses the multi-MB WebSocket 'done' frames
+    uvicorn.run(app, host="127.0.0.1", port=8081, log_level="info", ws_per_message_deflate=True)
@@ -17,6 +17,7 @@ Cache location: .cache/market_matches.db  (SQLite, sibling to this file)
 """
 
 import sqlite3
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -53,15 +54,33 @@ CREATE TABLE IF NOT EXISTS market_pairs (
     cached_at        TEXT NOT NULL,
     PRIMARY KEY (pm_market_id, ks_market_ticker)
 );
+
+-- Covering index for the per-event-pair lookup (served without the main table)
+CREATE INDEX IF NOT EXISTS idx_market_pairs_event ON market_pairs
+    (pm_event_id, ks_event_ticker, pm_market_id, ks_market_ticker, match_score);
 """
 
 
+# One connection per process, shared across worker threads and serialised by
+# _LOCK. Opened lazily so importing this module never touches the filesystem.
+_CONN: sqlite3.Connection | None = None
+_LOCK = threading.Lock()
+
+
 def _conn() -> sqlite3.Connection:
-    _CACHE_DIR.mkdir(exist_ok=True)
-    conn = sqlite3.connect(_CACHE_DB)
-    conn.row_factory = sqlite3.Row
-    conn.executescript(_SCHEMA)
-    return conn
+    """Return the shared cache connection. Callers must hold _LOCK."""
+    global _CONN
+    if _CONN is None:
+        _CACHE_DIR.mkdir(exist_ok=True)
+        conn = sqlite3.connect(_CACHE_DB, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.executescript(_SCHEMA)
+        _CONN = conn
+    return _CONN
 
 
 # ── Write ─────────────────────────────────────────────────────────────────────
@@ -73,8 +92,7 @@ def save_match(event_match: MatchResult, market_matches: list[MarketMatchResult]
     pe = event_match.poly_event
     ke = event_match.kalshi_event
 
-    conn = _conn()
-    with conn:
+    with _LOCK, _conn() as conn:
         conn.execute(
             """INSERT OR REPLACE INTO event_pairs
                (pm_event_id, ks_event_ticker, event_score,
@@ -83,14 +101,14 @@ def save_match(event_match: MatchResult, market_matches: list[MarketMatchResult]
             (pe.id, ke.id, event_match.score,
              pe.title, ke.title, pe.url, ke.url, now),
         )
-        for mm in market_matches:
-            conn.execute(
-                """INSERT OR REPLACE INTO market_pairs
-                   (pm_event_id, ks_event_ticker,
-                    pm_market_id, ks_market_ticker, match_score,
-                    pm_question, ks_question, pm_url, ks_url,
-                    pm_close_time, ks_close_time, cached_at)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+        conn.executemany(
+            """INSERT OR REPLACE INTO market_pairs
+               (pm_event_id, ks_event_ticker,
+                pm_market_id, ks_market_ticker, match_score,
+                pm_question, ks_question, pm_url, ks_url,
+                pm_close_time, ks_close_time, cached_at)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            [
                 (
                     pe.id, ke.id,
                     mm.poly_market.market_id,
@@ -103,9 +121,10 @@ def save_match(event_match: MatchResult, market_matches: list[MarketMatchResult]
                     mm.poly_market.close_time,
                     mm.kalshi_market.close_time,
                     now,
-                ),
-            )
-    conn.close()
+                )
+                for mm in market_matches
+            ],
+        )
 
 
 # ── Read ──────────────────────────────────────────────────────────────────────
@@ -125,14 +144,59 @@ def load_cached_market_matches(
     - Any current market ID/ticker is absent from the cached set (new bracket
       appeared since last run — must re-embed to cover it).
     """
-    conn = _conn()
-    rows = conn.execute(
-        "SELECT pm_market_id, ks_market_ticker, match_score "
-        "FROM market_pairs WHERE pm_event_id = ? AND ks_event_ticker = ?",
-        (pm_event.id, ks_event.id),
-    ).fetchall()
-    conn.close()
+    with _LOCK:
+        rows = _conn().execute(
+            "SELECT pm_market_id, ks_market_ticker, match_score "
+            "FROM market_pairs WHERE pm_event_id = ? AND ks_event_ticker = ?",
+            (pm_event.id, ks_event.id),
+        ).fetchall()
+
+    return _rebuild_market_matches(pm_event, ks_event, rows)
+
+
+def load_cached_market_matches_bulk(
+    event_pairs: list[tuple[NormalizedEvent, NormalizedEvent]],
+) -> dict[tuple[str, str], list[MarketMatchResult]]:
+    """Bulk version of load_cached_market_matches() — one SQL query for all pairs.
+
+    Returns {(pm_event_id, ks_event_ticker): [MarketMatchResult, ...]} holding
+    only the pairs that are cache hits; misses and invalidated pairs are absent.
+    """
+    if not event_pairs:
+        return {}
+
+    with _LOCK, _conn() as conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS pair_lookup (pm TEXT, ks TEXT)")
+        conn.execute("DELETE FROM pair_lookup")
+        conn.executemany(
+            "INSERT INTO pair_lookup (pm, ks) VALUES (?, ?)",
+            [(pe.id, ke.id) for pe, ke in event_pairs],
+        )
+        rows = conn.execute(
+            "SELECT m.pm_event_id, m.ks_event_ticker, "
+            "m.pm_market_id, m.ks_market_ticker, m.match_score "
+            "FROM market_pairs m JOIN pair_lookup q "
+            "ON m.pm_event_id = q.pm AND m.ks_event_ticker = q.ks"
+        ).fetchall()
+
+    rows_by_pair: dict[tuple[str, str], list] = {}
+    for row in rows:
+        rows_by_pair.setdefault((row["pm_event_id"], row["ks_event_ticker"]), []).append(row)
+
+    results: dict[tuple[str, str], list[MarketMatchResult]] = {}
+    for pe, ke in event_pairs:
+        cached = _rebuild_market_matches(pe, ke, rows_by_pair.get((pe.id, ke.id), []))
+        if cached is not None:
+            results[(pe.id, ke.id)] = cached
+    return results
 
+
+def _rebuild_market_matches(
+    pm_event: NormalizedEvent,
+    ks_event: NormalizedEvent,
+    rows: list,
+) -> list[MarketMatchResult] | None:
+    """Combine cached score rows with live markets; None on miss or invalidation."""
     if not rows:
         return None
 
@@ -162,34 +226,31 @@ def load_cached_market_matches(
 
 def lookup_event_pair(pm_event_id: str, ks_event_ticker: str) -> dict | None:
     """Return the cached event pair record, or None if not cached."""
-    conn = _conn()
-    row = conn.execute(
-        "SELECT * FROM event_pairs WHERE pm_event_id = ? AND ks_event_ticker = ?",
-        (pm_event_id, ks_event_ticker),
-    ).fetchone()
-    conn.close()
+    with _LOCK:
+        row = _conn().execute(
+            "SELECT * FROM event_pairs WHERE pm_event_id = ? AND ks_event_ticker = ?",
+            (pm_event_id, ks_event_ticker),
+        ).fetchone()
     return dict(row) if row else None
 
 
 def all_event_pairs() -> list[dict]:
     """Return every cached event pair (useful for external ID mapping scripts)."""
-    conn = _conn()
-    rows = conn.execute(
-        "SELECT pm_event_id, ks_event_ticker, event_score, "
-        "pm_title, ks_title, pm_url, ks_url, cached_at "
-        "FROM event_pairs ORDER BY cached_at DESC"
-    ).fetchall()
-    conn.close()
+    with _LOCK:
+        rows = _conn().execute(
+            "SELECT pm_event_id, ks_event_ticker, event_score, "
+            "pm_title, ks_title, pm_url, ks_url, cached_at "
+            "FROM event_pairs ORDER BY cached_at DESC"
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
 def all_market_pairs() -> list[dict]:
     """Return every cached market pair with full metadata."""
-    conn = _conn()
-    rows = conn.execute(
-        "SELECT * FROM market_pairs ORDER BY cached_at DESC"
-    ).fetchall()
-    conn.close()
+    with _LOCK:
+        rows = _conn().execute(
+            "SELECT * FROM market_pairs ORDER BY cached_at DESC"
+        ).fetchall()
     return [dict(r) for r in rows]
 
 
@@ -198,21 +259,19 @@ def all_market_pairs() -> list[dict]:
 
 def clear_cache() -> None:
     """Delete all cached match data."""
-    conn = _conn()
-    with conn:
+    with _LOCK, _conn() as conn:
         conn.execute("DELETE FROM market_pairs")
         conn.execute("DELETE FROM event_pairs")
-    conn.close()
 
 
 def cache_stats() -> dict:
     """Return a summary of what's stored in the cache."""
-    conn = _conn()
-    ep = conn.execute("SELECT COUNT(*) FROM event_pairs").fetchone()[0]
-    mp = conn.execute("SELECT COUNT(*) FROM market_pairs").fetchone()[0]
-    oldest = conn.execute("SELECT MIN(cached_at) FROM event_pairs").fetchone()[0]
-    newest = conn.execute("SELECT MAX(cached_at) FROM event_pairs").fetchone()[0]
-    conn.close()
+    with _LOCK:
+        conn = _conn()
+        ep = conn.execute("SELECT COUNT(*) FROM event_pairs").fetchone()[0]
+        mp = conn.execute("SELECT COUNT(*) FROM market_pairs").fetchone()[0]
+        oldest = conn.execute("SELECT MIN(cached_at) FROM event_pairs").fetchone()[0]
+        newest = conn.execute("SELECT MAX(cached_at) FROM event_pairs").fetchone()[0]
     return {
         "event_pairs": ep,
         "market_pairs": mp,
@@ -1,9 +1,15 @@
 import time
 import os
+import re
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
 import numpy as np
 from google import genai
 from google.genai.errors import ClientError
-from config import GEMINI_API_KEY
+from config import gemini_api_key
 
 MODEL = "gemini-embedding-001"
 _client: genai.Client | None = None
@@ -12,14 +18,29 @@ _client: genai.Client | None = None
 # Keep batches small and add backoff to stay within quota
 BATCH_SIZE = 80
 MAX_RETRIES = 5
+_RETRY_RE = re.compile(r"retry[^\d]*(\d+)", re.IGNORECASE)
+
+# Content-addressed embedding cache: sha256(model + text) → int8 vector + scale
+_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+_CACHE_DB = _CACHE_DIR / "embeddings.sqlite"
+_LOOKUP_CHUNK = 500  # stay well under SQLite's bound-parameter limit
+
+# In-process LRU in front of the on-disk cache, so repeated passes within a
+# run (event titles, then market questions per pair) skip SQLite entirely.
+# Entries are held as float16 (half the RAM of float32, cosine error <1e-4)
+# and upcast when embed_texts() assembles its float32 result.
+_MEMO_SIZE = 50_000
+_memo: OrderedDict[bytes, np.ndarray] = OrderedDict()
+_memo_lock = threading.Lock()
 
 
 def _get_client() -> genai.Client:
     global _client
     if _client is None:
-        if not GEMINI_API_KEY:
+        api_key = gemini_api_key()
+        if not api_key:
             raise RuntimeError("GEMINI_API_KEY not set. Add it to your .env file.")
-        _client = genai.Client(api_key=GEMINI_API_KEY)
+        _client = genai.Client(api_key=api_key)
     return _client
 
 
@@ -32,9 +53,7 @@ def _embed_batch(client: genai.Client, texts: list[str], retry: int = 0) -> list
         if exc.status_code == 429 and retry < MAX_RETRIES:
             # Parse suggested retry delay from error, default to 30s
             wait = 30
-            msg = str(exc)
-            import re
-            m = re.search(r"retry[^\d]*(\d+)", msg, re.IGNORECASE)
+            m = _RETRY_RE.search(str(exc))
             if m:
                 wait = int(m.group(1)) + 2
             time.sleep(wait)
@@ -42,30 +61,155 @@ def _embed_batch(client: genai.Client, texts: list[str], retry: int = 0) -> list
         raise
 
 
+def _text_key(text: str) -> bytes:
+    return hashlib.sha256(f"{MODEL}\0{text}".encode()).digest()
+
+
+def _cache_conn() -> sqlite3.Connection:
+    _CACHE_DIR.mkdir(exist_ok=True)
+    conn = sqlite3.connect(_CACHE_DB)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS embeddings "
+        "(hash BLOB PRIMARY KEY, scale REAL NOT NULL, vec BLOB NOT NULL)"
+    )
+    return conn
+
+
+def _load_cached(keys: list[bytes]) -> dict[bytes, np.ndarray]:
+    """Return {key: float32 vector} for every key already in the embedding cache."""
+    unique = list(set(keys))
+    hashes: list[bytes] = []
+    codes: list[np.ndarray] = []
+    scales: list[float] = []
+
+    conn = _cache_conn()
+    for i in range(0, len(unique), _LOOKUP_CHUNK):
+        chunk = unique[i : i + _LOOKUP_CHUNK]
+        rows = conn.execute(
+            f"SELECT hash, scale, vec FROM embeddings WHERE hash IN ({','.join('?' * len(chunk))})",
+            chunk,
+        ).fetchall()
+        for h, scale, blob in rows:
+            hashes.append(h)
+            scales.append(scale)
+            codes.append(np.frombuffer(blob, dtype=np.int8))
+    conn.close()
+
+    if not hashes:
+        return {}
+    vectors = _l2_normalize(dequantize_int8(np.stack(codes), np.array(scales, dtype=np.float32)))
+    return dict(zip(hashes, vectors))
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in place (zero rows are left as zeros)."""
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-10
+    return vectors
+
+
+def _memo_get(keys: list[bytes]) -> dict[bytes, np.ndarray]:
+    found: dict[bytes, np.ndarray] = {}
+    with _memo_lock:
+        for k in keys:
+            vec = _memo.get(k)
+            if vec is not None:
+                _memo.move_to_end(k)
+                found[k] = vec
+    return found
+
+
+def _memo_put(items: dict[bytes, np.ndarray]) -> None:
+    items = {k: v.astype(np.float16) for k, v in items.items()}
+    with _memo_lock:
+        _memo.update(items)
+        for k in items:
+            _memo.move_to_end(k)
+        while len(_memo) > _MEMO_SIZE:
+            _memo.popitem(last=False)
+
+
+def _store_cached(keys: list[bytes], vectors: np.ndarray) -> None:
+    codes, scales = quantize_int8(vectors)
+    conn = _cache_conn()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (hash, scale, vec) VALUES (?, ?, ?)",
+            [(k, float(s), c.tobytes()) for k, s, c in zip(keys, scales, codes)],
+        )
+    conn.close()
+
+
 def embed_texts(texts: list[str]) -> np.ndarray:
     """
-    Embed a list of texts using Gemini. Returns an (N, D) float32 array.
+    Embed a list of texts using Gemini. Returns an (N, D) float32 array of
+    L2-normalized rows, ready for cosine_similarity_matrix().
     Batches requests to stay within API limits, retrying on rate-limit errors.
+
+    Vectors are persisted to .cache/embeddings.sqlite keyed by
+    sha256(model + text) and memoized in-process (LRU); only texts missing
+    from both hit the API.
     """
-    client = _get_client()
-    all_vectors: list[list[float]] = []
+    keys = [_text_key(t) for t in texts]
+    by_key = _memo_get(keys)
+    unseen = [k for k in dict.fromkeys(keys) if k not in by_key]
+    if unseen:
+        from_disk = _load_cached(unseen)
+        _memo_put(from_disk)
+        by_key.update(from_disk)
 
-    for i in range(0, len(texts), BATCH_SIZE):
-        batch = texts[i : i + BATCH_SIZE]
-        vectors = _embed_batch(client, batch)
-        all_vectors.extend(vectors)
-        # Small sleep between batches to stay under 3000 texts/min
-        if i + BATCH_SIZE < len(texts):
-            time.sleep(1.6)
+    # Unique uncached texts, in first-seen order
+    misses = list(dict.fromkeys(t for t, k in zip(texts, keys) if k not in by_key))
+    if misses:
+        client = _get_client()
+        all_vectors: list[list[float]] = []
 
-    return np.array(all_vectors, dtype=np.float32)
+        for i in range(0, len(misses), BATCH_SIZE):
+            batch = misses[i : i + BATCH_SIZE]
+            vectors = _embed_batch(client, batch)
+            all_vectors.extend(vectors)
+            # Small sleep between batches to stay under 3000 texts/min
+            if i + BATCH_SIZE < len(misses):
+                time.sleep(1.6)
+
+        fresh = _l2_normalize(np.array(all_vectors, dtype=np.float32))
+        miss_keys = [_text_key(t) for t in misses]
+        _store_cached(miss_keys, fresh)
+        fresh_by_key = dict(zip(miss_keys, fresh))
+        _memo_put(fresh_by_key)
+        by_key.update(fresh_by_key)
+
+    return np.array([by_key[k] for k in keys], dtype=np.float32)
 
 
 def cosine_similarity_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
     """
     Compute cosine similarity between every row of A and every row of B.
     Returns an (len(a), len(b)) matrix with values in [-1, 1].
+
+    Precondition: rows of A and B are L2-normalized (embed_texts() output is),
+    so cosine reduces to a single float32 GEMM with no per-element division.
     """
-    a_norm = a / (np.linalg.norm(a, axis=1, keepdims=True) + 1e-10)
-    b_norm = b / (np.linalg.norm(b, axis=1, keepdims=True) + 1e-10)
-    return a_norm @ b_norm.T
+    return np.matmul(np.asarray(a, dtype=np.float32), np.asarray(b, dtype=np.float32).T)
+
+
+def quantize_int8(vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Quantize (N, D) float vectors to int8 with one symmetric scale per row.
+    Returns (codes, scales): an (N, D) int8 array and an (N,) float32 array.
+
+    A per-row scale keeps the rounding error well below the match thresholds
+    (cosine error ~1e-3 on 3072-d vectors) at a quarter of the float32 size.
+    Use for storage only: NumPy has no BLAS path for int8 matmul, so similarity
+    should run on dequantize_int8() output, re-normalized, via
+    cosine_similarity_matrix().
+    """
+    v = np.asarray(vectors, dtype=np.float32)
+    scales = np.abs(v).max(axis=1) / 127.0
+    scales[scales == 0] = 1.0
+    codes = np.round(v / scales[:, None]).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantize_int8(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Inverse of quantize_int8(). Returns an (N, D) float32 array."""
+    return codes.astype(np.float32) * scales[:, None]
@@ -1,13 +1,36 @@
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from models import NormalizedEvent, NormalizedMarket
-from config import KALSHI_API_KEY
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from models import NormalizedEvent, NormalizedMarket, fmt_price_pair
+from config import kalshi_api_key
 
 # NOTE: api.kalshi.com has moved; use api.elections.kalshi.com for public access
 BASE_URL = "https://api.elections.kalshi.com/trade-api/v2"
 EVENT_URL = "https://kalshi.com/events"
 
+# Shared keep-alive session: reuses TLS connections across pages and calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+))
+
 
 def _safe_float(val, default=0.0) -> float:
+    # Type-checked fast paths keep the common cases (floats, ints, missing
+    # fields) off the exception machinery; only strings can still fail to parse.
+    t = type(val)
+    if t is float:
+        return val
+    if t is int:
+        return float(val)
+    if val is None or val == "":
+        return default
     try:
         return float(val)
     except (TypeError, ValueError):
@@ -34,6 +57,11 @@ def _build_question(m: dict, event_title: str) -> str:
     return title
 
 
+def _intern(val):
+    """sys.intern() for strings; repeated titles/categories then share one object."""
+    return sys.intern(val) if isinstance(val, str) else val
+
+
 def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: str = "", event_url: str = "") -> NormalizedMarket:
     # Kalshi API returns prices as *_dollars fields in 0.0–1.0 range (dollar price on $1 contract).
     # Use ask prices so the cost-to-enter calculation is accurate.
@@ -42,8 +70,9 @@ def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: st
     if no_price == 0.0 and yes_price > 0.0:
         no_price = round(1.0 - yes_price, 4)
 
+    question = _build_question(m, parent_event_title)
     return NormalizedMarket(
-        question=_build_question(m, parent_event_title),
+        question=question,
         yes_price=yes_price,
         no_price=no_price,
         volume=_safe_float(m.get("volume_fp") or m.get("volume", 0)),
@@ -53,12 +82,13 @@ def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: st
         parent_event_title=parent_event_title,
         close_time=(m.get("close_time") or "")[:10],
         url=event_url,
+        display_question=question.removeprefix(parent_event_title + ": "),
     )
 
 
 def _normalize_event(e: dict) -> NormalizedEvent:
     ticker = e.get("event_ticker", e.get("ticker", ""))
-    event_title = e.get("title", "")
+    event_title = _intern(e.get("title", ""))
 
     # Direct event URL — no extra API call needed.
     event_url = f"{EVENT_URL}/{ticker.lower()}"
@@ -77,34 +107,62 @@ def _normalize_event(e: dict) -> NormalizedEvent:
         source="kalshi",
         id=ticker,
         title=event_title,
-        category=e.get("category", "Other"),
+        category=_intern(e.get("category", "Other")),
         volume=total_volume,
         liquidity=_safe_float(e.get("liquidity")),
         end_date=end_date,
         url=event_url,
         markets=markets,
+        top_price_display=fmt_price_pair(markets[0]) if markets else "—",
     )
 
 
 def _get_headers() -> dict:
     headers = {"Content-Type": "application/json"}
-    if KALSHI_API_KEY:
-        headers["Authorization"] = f"Bearer {KALSHI_API_KEY}"
+    api_key = kalshi_api_key()
+    if api_key:
+        headers["Authorization"] = f"Bearer {api_key}"
     return headers
 
 
-def fetch_events(limit: int = 100, status: str = "open", category: str | None = None) -> list[NormalizedEvent]:
+def _fetch_page(params: dict) -> dict:
+    try:
+        resp = _SESSION.get(
+            f"{BASE_URL}/events",
+            params=params,
+            headers=_get_headers(),
+            timeout=15,
+        )
+        resp.raise_for_status()
+    except requests.HTTPError as exc:
+        status_code = exc.response.status_code if exc.response is not None else None
+        if status_code == 401:
+            raise RuntimeError(
+                "Kalshi requires authentication. Set KALSHI_API_KEY in your .env file."
+            ) from exc
+        if status_code == 403:
+            raise RuntimeError(
+                "Kalshi access forbidden. Check your KALSHI_API_KEY permissions."
+            ) from exc
+        raise RuntimeError(f"Kalshi API error: {exc}") from exc
+    except requests.RequestException as exc:
+        raise RuntimeError(f"Kalshi API error: {exc}") from exc
+    return orjson.loads(resp.content)
+
+
+def iter_events(limit: int = 100, status: str = "open", category: str | None = None) -> Iterator[NormalizedEvent]:
+    """Yield up to `limit` normalized events page by page, as pages arrive."""
     from comparator import normalize_category as _norm_cat
 
-    events: list[NormalizedEvent] = []
-    cursor: str | None = None
+    if limit <= 0:
+        return
     # When filtering by category we may need to over-fetch since Kalshi has no
     # general category param (only series_ticker, which is a specific series ID).
     # Fetch up to 3× the limit to have enough events after filtering.
     fetch_limit = limit * 3 if category else limit
     page_size = min(fetch_limit, 200)
 
-    while len(events) < fetch_limit:
+    def page_params(cursor: str | None) -> dict:
         params: dict = {
             "limit": page_size,
             "with_nested_markets": "true",
@@ -112,45 +170,42 @@ def fetch_events(limit: int = 100, status: str = "open", category: str | None =
         }
         if cursor:
             params["cursor"] = cursor
+        return params
+
+    target = _norm_cat(category) if category else None
+    fetched = 0   # raw events seen, bounded by fetch_limit
+    yielded = 0   # events passed to the caller, bounded by limit
 
-        try:
-            resp = requests.get(
-                f"{BASE_URL}/events",
-                params=params,
-                headers=_get_headers(),
-                timeout=15,
-            )
-            resp.raise_for_status()
-        except requests.HTTPError as exc:
-            status_code = exc.response.status_code if exc.response is not None else None
-            if status_code == 401:
-                raise RuntimeError(
-                    "Kalshi requires authentication. Set KALSHI_API_KEY in your .env file."
-                ) from exc
-            if status_code == 403:
-                raise RuntimeError(
-                    "Kalshi access forbidden. Check your KALSHI_API_KEY permissions."
-                ) from exc
-            raise RuntimeError(f"Kalshi API error: {exc}") from exc
-        except requests.RequestException as exc:
-            raise RuntimeError(f"Kalshi API error: {exc}") from exc
-
-        body = resp.json()
-        page = body.get("events", [])
-        if not page:
-            break
-
-        for e in page:
-            events.append(_normalize_event(e))
-            if len(events) >= fetch_limit:
+    # Pagination is cursor-based, so pages can't be requested in parallel —
+    # but the next cursor arrives with each page, so fetch page N+1 in the
+    # background while page N is being normalized.
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = pool.submit(_fetch_page, page_params(None))
+        while pending is not None:
+            body = pending.result()
+            pending = None
+            page = body.get("events", [])
+            if not page:
                 break
 
-        cursor = body.get("cursor")
-        if not cursor or len(page) < page_size:
-            break
+            cursor = body.get("cursor")
+            if cursor and len(page) >= page_size and fetched + len(page) < fetch_limit:
+                pending = pool.submit(_fetch_page, page_params(cursor))
 
-    if category:
-        target = _norm_cat(category)
-        events = [e for e in events if _norm_cat(e.category) == target]
+            for e in page:
+                event = _normalize_event(e)
+                fetched += 1
+                if target is None or _norm_cat(event.category) == target:
+                    yield event
+                    yielded += 1
+                    if yielded >= limit:
+                        return
+                if fetched >= fetch_limit:
+                    break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-    return events[:limit]
+
+def fetch_events(limit: int = 100, status: str = "open", category: str | None = None) -> list[NormalizedEvent]:
+    return list(iter_events(limit=limit, status=status, category=category))
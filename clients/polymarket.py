@@ -1,25 +1,53 @@
-import json
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 import requests
-from models import NormalizedEvent, NormalizedMarket
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from models import NormalizedEvent, NormalizedMarket, fmt_price_pair
 
 BASE_URL = "https://gamma-api.polymarket.com"
 MARKET_URL = "https://polymarket.com/event"
+PAGE_WORKERS = 4  # offset pages fetched concurrently
+
+# Shared keep-alive session: reuses TLS connections across pages and calls
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503]),
+))
 
 
 def _safe_float(val, default=0.0) -> float:
+    # Type-checked fast paths keep the common cases (floats, ints, missing
+    # fields) off the exception machinery; only strings can still fail to parse.
+    t = type(val)
+    if t is float:
+        return val
+    if t is int:
+        return float(val)
+    if val is None or val == "":
+        return default
     try:
         return float(val)
     except (TypeError, ValueError):
         return default
 
 
+def _intern(val):
+    """sys.intern() for strings; repeated titles/categories then share one object."""
+    return sys.intern(val) if isinstance(val, str) else val
+
+
 def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: str = "", parent_event_url: str = "") -> NormalizedMarket:
     # outcomePrices is a JSON-encoded string, e.g. '["0.65", "0.35"]' (mid prices)
     raw_prices = m.get("outcomePrices", [])
     if isinstance(raw_prices, str):
         try:
-            raw_prices = json.loads(raw_prices)
-        except (json.JSONDecodeError, ValueError):
+            raw_prices = orjson.loads(raw_prices)
+        except (orjson.JSONDecodeError, ValueError):
             raw_prices = []
 
     # Use ask prices: cost to actually buy each side
@@ -35,8 +63,9 @@ def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: st
     else:
         no_price = _safe_float(raw_prices[1]) if len(raw_prices) > 1 else round(1.0 - yes_price, 4)
 
+    question = m.get("question", "")
     return NormalizedMarket(
-        question=m.get("question", ""),
+        question=question,
         yes_price=yes_price,
         no_price=no_price,
         volume=_safe_float(m.get("volume")),
@@ -46,6 +75,7 @@ def _normalize_market(m: dict, parent_event_id: str = "", parent_event_title: st
         parent_event_title=parent_event_title,
         close_time=(m.get("endDate") or "")[:10],
         url=parent_event_url,
+        display_question=question.removeprefix(parent_event_title + ": "),
     )
 
 
@@ -57,7 +87,7 @@ def _is_settled(m: NormalizedMarket) -> bool:
 
 def _normalize_event(e: dict) -> NormalizedEvent:
     event_id = str(e.get("id", ""))
-    event_title = e.get("title", "")
+    event_title = _intern(e.get("title", ""))
 
     # Only include open (non-closed) sub-markets and filter out settled ones
     event_url = f"{MARKET_URL}/{e.get('slug', '')}"
@@ -72,49 +102,65 @@ def _normalize_event(e: dict) -> NormalizedEvent:
         source="polymarket",
         id=event_id,
         title=event_title,
-        category=category,
+        category=_intern(category),
         volume=_safe_float(e.get("volume")),
         liquidity=_safe_float(e.get("liquidity")),
         end_date=(e.get("endDate") or "")[:10],
         url=f"{MARKET_URL}/{e.get('slug', '')}",
         markets=markets,
+        top_price_display=fmt_price_pair(markets[0]) if markets else "—",
     )
 
 
-def fetch_events(limit: int = 100, category: str | None = None) -> list[NormalizedEvent]:
-    events: list[NormalizedEvent] = []
-    offset = 0
+def _fetch_page(params: dict) -> list[dict]:
+    try:
+        resp = _SESSION.get(f"{BASE_URL}/events", params=params, timeout=15)
+        resp.raise_for_status()
+    except requests.RequestException as exc:
+        raise RuntimeError(f"Polymarket API error: {exc}") from exc
+    return orjson.loads(resp.content)
+
+
+def iter_events(limit: int = 100, category: str | None = None) -> Iterator[NormalizedEvent]:
+    """Yield up to `limit` normalized events page by page, as pages arrive."""
+    if limit <= 0:
+        return
     page_size = min(limit, 100)
 
-    while len(events) < limit:
-        params: dict = {
-            "limit": page_size,
-            "offset": offset,
-            "active": "true",
-            "closed": "false",
-            "order": "volume24hr",
-            "ascending": "false",
-        }
-        if category:
-            params["category"] = category
+    base_params: dict = {
+        "limit": page_size,
+        "active": "true",
+        "closed": "false",
+        "order": "volume24hr",
+        "ascending": "false",
+    }
+    if category:
+        base_params["category"] = category
+
+    # Offsets are known up front, so request the pages concurrently and
+    # consume them in order; stop at the first short page as before.
+    pool = ThreadPoolExecutor(max_workers=PAGE_WORKERS)
+    try:
+        pages = pool.map(
+            lambda offset: _fetch_page({**base_params, "offset": offset}),
+            range(0, limit, page_size),
+        )
+        yielded = 0
+        for data in pages:
+            if not data:
+                break
 
-        try:
-            resp = requests.get(f"{BASE_URL}/events", params=params, timeout=15)
-            resp.raise_for_status()
-        except requests.RequestException as exc:
-            raise RuntimeError(f"Polymarket API error: {exc}") from exc
-
-        data = resp.json()
-        if not data:
-            break
-
-        for e in data:
-            events.append(_normalize_event(e))
-            if len(events) >= limit:
+            for e in data:
+                yield _normalize_event(e)
+                yielded += 1
+                if yielded >= limit:
+                    return
+
+            if len(data) < page_size:
                 break
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
-        if len(data) < page_size:
-            break
-        offset += page_size
 
-    return events
+def fetch_events(limit: int = 100, category: str | None = None) -> list[NormalizedEvent]:
+    return list(iter_events(limit=limit, category=category))
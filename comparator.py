@@ -1,7 +1,13 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date as _date
+import numpy as np
 from models import NormalizedEvent, NormalizedMarket, MatchResult, MarketMatchResult, ArbitrageResult
 from matchers import EventMatcher, default_matcher
 
+# Threads used to match sub-markets of different event pairs concurrently
+MARKET_MATCH_WORKERS = 8
+
 # Map common category name variants to a canonical label
 CATEGORY_ALIASES: dict[str, str] = {
     "crypto": "Crypto",
@@ -59,9 +65,36 @@ def _filter_events_by_days(events: list[NormalizedEvent], max_days: int) -> list
     return result
 
 
+def _close_dates(markets: list[NormalizedMarket]) -> np.ndarray:
+    """
+    datetime64[D] close date per market (NaT if missing/unparseable).
+    Each distinct close_time string is parsed only once.
+    """
+    parsed: dict[str, np.datetime64] = {}
+    out = np.empty(len(markets), dtype="datetime64[D]")
+    for i, m in enumerate(markets):
+        ct = m.close_time
+        d = parsed.get(ct)
+        if d is None:
+            d = np.datetime64("NaT", "D")
+            if ct:
+                try:
+                    d = np.datetime64(_date.fromisoformat(ct[:10]), "D")
+                except ValueError:
+                    pass
+            parsed[ct] = d
+        out[i] = d
+    return out
+
+
+# Lookup keyed by casefolded alias, so API category strings match regardless of case
+_CATEGORY_LOOKUP: dict[str, str] = {k.casefold(): v for k, v in CATEGORY_ALIASES.items()}
+
+
 def normalize_category(raw: str) -> str:
-    key = raw.strip().lower()
-    return CATEGORY_ALIASES.get(key, raw.title() if raw else "Other")
+    if not raw:
+        return "Other"
+    return _CATEGORY_LOOKUP.get(raw.strip().casefold()) or raw.title()
 
 
 # ── Sub-market / bracket level matching (two-level) ──────────────────────────
@@ -103,15 +136,41 @@ def find_market_matches(
 
     event_matches = matcher.match_events(poly_events, kalshi_events, event_min_score)
 
-    results: list[tuple[MatchResult, list[MarketMatchResult]]] = []
+    # One bulk cache query for every pair that would otherwise hit the matcher
+    cached_by_pair: dict[tuple[str, str], list[MarketMatchResult]] = {}
+    if use_cache and not refresh_cache:
+        from cache import load_cached_market_matches_bulk
+        cached_by_pair = load_cached_market_matches_bulk(
+            [(em.poly_event, em.kalshi_event) for em in event_matches]
+        )
+
+    # Let the matcher warm up on every pair that will reach match_markets()
+    # (e.g. one embedding call for all questions instead of one per pair)
+    prefetch = getattr(matcher, "prefetch_markets", None)
+    if prefetch is not None:
+        market_lists: list[list[NormalizedMarket]] = []
+        for em in event_matches:
+            pm_markets = em.poly_event.markets
+            ks_markets = em.kalshi_event.markets
+            if not pm_markets or not ks_markets:
+                continue
+            if len(pm_markets) == 1 and len(ks_markets) == 1:
+                continue
+            if (em.poly_event.id, em.kalshi_event.id) in cached_by_pair:
+                continue
+            market_lists += [pm_markets, ks_markets]
+        if market_lists:
+            prefetch(market_lists)
 
-    for em in event_matches:
+    if use_cache:
+        from cache import save_match
+
+    def match_pair(em: MatchResult) -> tuple[MatchResult, list[MarketMatchResult]]:
         pm_markets = em.poly_event.markets
         ks_markets = em.kalshi_event.markets
 
         if not pm_markets or not ks_markets:
-            results.append((em, []))
-            continue
+            return em, []
 
         # Single-market on both sides: the event match IS the bracket match.
         # Skip re-embedding to avoid false negatives when market question
@@ -122,28 +181,27 @@ def find_market_matches(
                 kalshi_market=ks_markets[0],
                 score=em.score,
             )]
-            results.append((em, single_mm))
             if use_cache:
-                from cache import save_match
                 save_match(em, single_mm)
-            continue
+            return em, single_mm
 
         # Check cache before calling the matcher
-        if use_cache and not refresh_cache:
-            from cache import load_cached_market_matches
-            cached = load_cached_market_matches(em.poly_event, em.kalshi_event)
-            if cached is not None:
-                results.append((em, cached))
-                continue
+        cached = cached_by_pair.get((em.poly_event.id, em.kalshi_event.id))
+        if cached is not None:
+            return em, cached
 
         market_matches = matcher.match_markets(pm_markets, ks_markets, market_min_score)
-        results.append((em, market_matches))
-
         if use_cache:
-            from cache import save_match
-            save_match(em, market_matches)
+            save_match(em, market_matches)  # serialized by cache._LOCK
+        return em, market_matches
 
-    return results
+    if len(event_matches) <= 1:
+        return [match_pair(em) for em in event_matches]
+
+    # Pairs are independent: overlap embedding calls / GIL-free cdist across
+    # threads. map() keeps results in event_matches order.
+    with ThreadPoolExecutor(max_workers=min(MARKET_MATCH_WORKERS, len(event_matches))) as pool:
+        return list(pool.map(match_pair, event_matches))
 
 
 # ── Arbitrage detection ───────────────────────────────────────────────────────
@@ -177,69 +235,75 @@ def find_arbitrage(
 
     results: list[ArbitrageResult] = []
 
-    for _event_match, market_matches in pairs:
-        for mm in market_matches:
-            pm = mm.poly_market
-            ks = mm.kalshi_market
-
-            spread_pm_yes = pm.yes_price + ks.no_price   # buy Yes on PM, No on KS
-            spread_ks_yes = ks.yes_price + pm.no_price   # buy Yes on KS, No on PM
-
-            if spread_pm_yes <= spread_ks_yes:
-                best_leg = "pm_yes_ks_no"
-                spread = spread_pm_yes
-            else:
-                best_leg = "ks_yes_pm_no"
-                spread = spread_ks_yes
-
-            profit = 1.0 - spread
-            if profit <= min_profit:
-                continue
-
-            # Days to resolution: use the earlier of the two close dates
-            days: int | None = None
-            ann: float | None = None
-            close_dates = []
-            for ct in [pm.close_time, ks.close_time]:
-                if ct:
-                    try:
-                        close_dates.append(_date.fromisoformat(ct[:10]))
-                    except ValueError:
-                        pass
-            if close_dates:
-                earliest = min(close_dates)
-                days = (earliest - today).days
-                if max_days is not None and days > max_days:
-                    continue
-                if days > 0:
-                    ann = (profit / days) * 365
-
-            results.append(ArbitrageResult(
-                poly_market=pm,
-                kalshi_market=ks,
-                match_score=mm.score,
-                best_leg=best_leg,
-                spread=round(spread, 4),
-                profit=round(profit, 4),
-                days_to_resolution=days,
-                annualized_return=round(ann, 4) if ann is not None else None,
-            ))
-
-    # Sort: dated entries by annualized_return desc, then undated by profit desc
-    results.sort(key=lambda r: (
-        r.annualized_return is None,          # False (0) sorts before True (1)
-        -(r.annualized_return or 0),
-        -r.profit,
-    ))
-    return results
+    market_matches = [mm for _event_match, mms in pairs for mm in mms]
+    if not market_matches:
+        return results
+
+    # Spread/profit for every bracket pair at once; only survivors reach Python
+    prices = np.array(
+        [(mm.poly_market.yes_price, mm.kalshi_market.no_price,
+          mm.kalshi_market.yes_price, mm.poly_market.no_price) for mm in market_matches],
+        dtype=np.float64,
+    )
+    spread_pm_yes = prices[:, 0] + prices[:, 1]   # buy Yes on PM, No on KS
+    spread_ks_yes = prices[:, 2] + prices[:, 3]   # buy Yes on KS, No on PM
+    pm_leg = spread_pm_yes <= spread_ks_yes
+    spreads = np.where(pm_leg, spread_pm_yes, spread_ks_yes)
+    profits = 1.0 - spreads
+
+    # Days to resolution: use the earlier of the two close dates (fmin skips NaT)
+    earliest = np.fmin(
+        _close_dates([mm.poly_market for mm in market_matches]),
+        _close_dates([mm.kalshi_market for mm in market_matches]),
+    )
+    has_date = ~np.isnat(earliest)
+    days_left = np.where(has_date, earliest - np.datetime64(today, "D"), 0).astype(np.int64)
+
+    keep = profits > min_profit
+    if max_days is not None:
+        keep &= ~has_date | (days_left <= max_days)
+
+    for idx in np.flatnonzero(keep):
+        mm = market_matches[idx]
+        best_leg = "pm_yes_ks_no" if pm_leg[idx] else "ks_yes_pm_no"
+        spread = float(spreads[idx])
+        profit = float(profits[idx])
+
+        days: int | None = None
+        ann: float | None = None
+        if has_date[idx]:
+            days = int(days_left[idx])
+            if days > 0:
+                ann = (profit / days) * 365
+
+        results.append(ArbitrageResult(
+            poly_market=mm.poly_market,
+            kalshi_market=mm.kalshi_market,
+            match_score=mm.score,
+            best_leg=best_leg,
+            spread=round(spread, 4),
+            profit=round(profit, 4),
+            days_to_resolution=days,
+            annualized_return=round(ann, 4) if ann is not None else None,
+        ))
+
+    # Sort: dated entries by annualized_return desc, then undated by profit desc.
+    # lexsort is stable and its last key is primary.
+    ann_arr = np.array(
+        [np.nan if r.annualized_return is None else r.annualized_return for r in results],
+        dtype=np.float64,
+    )
+    profit_arr = np.array([r.profit for r in results], dtype=np.float64)
+    undated = np.isnan(ann_arr)                 # False (0) sorts before True (1)
+    order = np.lexsort((-profit_arr, np.where(undated, 0.0, -ann_arr), undated))
+    return [results[i] for i in order]
 
 
 # ── Category grouping ─────────────────────────────────────────────────────────
 
 
 def group_by_category(events: list[NormalizedEvent]) -> dict[str, list[NormalizedEvent]]:
-    groups: dict[str, list[NormalizedEvent]] = {}
+    groups: defaultdict[str, list[NormalizedEvent]] = defaultdict(list)
     for e in events:
-        cat = normalize_category(e.category)
-        groups.setdefault(cat, []).append(e)
+        groups[normalize_category(e.category)].append(e)
     return dict(sorted(groups.items()))
@@ -1,16 +1,56 @@
 import os
+from functools import cache
 from pathlib import Path
 
-# Load .env file if present
 _env_path = Path(__file__).parent / ".env"
-if _env_path.exists():
-    try:
-        from dotenv import load_dotenv
-        load_dotenv(_env_path)
-    except ImportError:
-        pass
-
-KALSHI_API_KEY: str | None = os.environ.get("KALSHI_API_KEY")
-KALSHI_API_EMAIL: str | None = os.environ.get("KALSHI_API_EMAIL")
-KALSHI_API_PASSWORD: str | None = os.environ.get("KALSHI_API_PASSWORD")
-GEMINI_API_KEY: str | None = os.environ.get("GEMINI_API_KEY")
+
+
+@cache
+def _load_env() -> None:
+    """Load the .env file (if present) into os.environ, once, on first use."""
+    if _env_path.exists():
+        try:
+            from dotenv import load_dotenv
+            load_dotenv(_env_path)
+        except ImportError:
+            pass
+
+
+def _env(name: str) -> str | None:
+    _load_env()
+    return os.environ.get(name)
+
+
+@cache
+def kalshi_api_key() -> str | None:
+    return _env("KALSHI_API_KEY")
+
+
+@cache
+def kalshi_api_email() -> str | None:
+    return _env("KALSHI_API_EMAIL")
+
+
+@cache
+def kalshi_api_password() -> str | None:
+    return _env("KALSHI_API_PASSWORD")
+
+
+@cache
+def gemini_api_key() -> str | None:
+    return _env("GEMINI_API_KEY")
+
+
+# Old constant names (config.GEMINI_API_KEY, ...) still resolve, lazily
+_LAZY_CONSTANTS = {
+    "KALSHI_API_KEY": kalshi_api_key,
+    "KALSHI_API_EMAIL": kalshi_api_email,
+    "KALSHI_API_PASSWORD": kalshi_api_password,
+    "GEMINI_API_KEY": gemini_api_key,
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_CONSTANTS:
+        return _LAZY_CONSTANTS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,18 +12,20 @@ Usage:
 
 import argparse
 import sys
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 
+# Only what the banner and _link() need is imported up front; tables, rules and
+# the matching stack (NumPy, RapidFuzz, Gemini) load inside the commands that use them.
 from rich.console import Console
-from rich.table import Table
-from rich import box
 from rich.text import Text
 from rich.panel import Panel
-from rich.rule import Rule
 
-from comparator import find_market_matches, find_arbitrage, group_by_category, normalize_category
-from matchers import default_matcher
-from models import NormalizedEvent, NormalizedMarket, MatchResult, MarketMatchResult, ArbitrageResult
+from models import (
+    NormalizedEvent, NormalizedMarket, MatchResult, MarketMatchResult, ArbitrageResult,
+    fmt_price, fmt_price_pair,
+)
 
 console = Console()
 _mobile: bool = False  # set True via --mobile; narrows tables and disables hyperlinks
@@ -39,10 +41,6 @@ def _link(text: str, url: str) -> Text:
     return Text(text)
 
 
-def _fmt_price(price: float) -> str:
-    return f"{price * 100:.1f}¢"
-
-
 def _fmt_volume(vol: float) -> str:
     if vol >= 1_000_000:
         return f"${vol / 1_000_000:.1f}M"
@@ -51,21 +49,12 @@ def _fmt_volume(vol: float) -> str:
     return f"${vol:.0f}"
 
 
-def _fmt_price_pair(m: NormalizedMarket) -> str:
-    return f"Yes {_fmt_price(m.yes_price)} / No {_fmt_price(m.no_price)}"
-
-
 def _fmt_price_pair_short(m: NormalizedMarket) -> str:
     """Compact price pair for narrow mobile columns: 'Y:51 N:49'."""
     return f"Y:{m.yes_price * 100:.0f} N:{m.no_price * 100:.0f}"
 
 
-def _top_market_price(event: NormalizedEvent) -> str:
-    if not event.markets:
-        return "—"
-    return _fmt_price_pair(event.markets[0])
-
-
+@lru_cache(maxsize=1024)  # scores are rounded to 4 dp, so rows repeat values
 def _score_color(score: float) -> str:
     s = score / 100.0 if score > 1.0 else score
     if s >= 0.92:
@@ -75,10 +64,107 @@ def _score_color(score: float) -> str:
     return "red"
 
 
+_score_key = attrgetter("score")  # C-level sort key for match results
+
+
 def _fmt_score(score: float) -> str:
     return f"{score:.3f}" if score <= 1.0 else f"{score:.0f}"
 
 
+# ── table layouts ─────────────────────────────────────────────────────────────
+
+# (column name, add_column kwargs) per layout; _new_table() picks mobile or desktop
+
+_EVENT_COLS_MOBILE = (
+    ("Title", {"max_width": 28, "no_wrap": False}),
+    ("Price", {"width": 16}),
+    ("Ends", {"width": 10}),
+)
+_EVENT_COLS_DESKTOP = (
+    ("Title", {"min_width": 30, "max_width": 55, "no_wrap": False}),
+    ("Category", {"width": 14}),
+    ("Top Market", {"width": 22}),
+    ("Volume", {"width": 10, "justify": "right"}),
+    ("End Date", {"width": 12}),
+)
+
+_EVENT_MATCH_COLS_MOBILE = (
+    ("Polymarket", {"max_width": 24, "no_wrap": False}),
+    ("~", {"width": 5, "justify": "center"}),
+    ("Kalshi", {"max_width": 24, "no_wrap": False}),
+)
+_EVENT_MATCH_COLS_DESKTOP = (
+    ("Polymarket", {"min_width": 28, "max_width": 40, "no_wrap": False}),
+    ("PM Price", {"width": 14, "justify": "center"}),
+    ("Score", {"width": 7, "justify": "center"}),
+    ("Kalshi Price", {"width": 14, "justify": "center"}),
+    ("Kalshi", {"min_width": 28, "max_width": 40, "no_wrap": False}),
+)
+
+_BRACKET_COLS_MOBILE = (
+    ("Polymarket bracket", {"max_width": 20, "no_wrap": False}),
+    ("PM", {"width": 10, "justify": "center"}),
+    ("~", {"width": 5, "justify": "center"}),
+    ("KS", {"width": 10, "justify": "center"}),
+    ("Kalshi bracket", {"max_width": 20, "no_wrap": False}),
+)
+_BRACKET_COLS_DESKTOP = (
+    ("Polymarket bracket", {"min_width": 32, "max_width": 50, "no_wrap": False}),
+    ("PM price", {"width": 14, "justify": "center"}),
+    ("Score", {"width": 7, "justify": "center"}),
+    ("Kalshi price", {"width": 14, "justify": "center"}),
+    ("Kalshi bracket", {"min_width": 32, "max_width": 50, "no_wrap": False}),
+)
+
+_CACHE_PAIR_COLS_MOBILE = (
+    ("Polymarket Event", {"max_width": 24, "no_wrap": False}),
+    ("~", {"width": 5, "justify": "center"}),
+    ("Kalshi Event", {"max_width": 24, "no_wrap": False}),
+    ("Ticker", {"width": 16}),
+)
+_CACHE_PAIR_COLS_DESKTOP = (
+    ("Polymarket Event", {"min_width": 28, "max_width": 44, "no_wrap": False}),
+    ("PM ID", {"width": 10}),
+    ("Score", {"width": 7, "justify": "center"}),
+    ("Kalshi Event", {"min_width": 28, "max_width": 44, "no_wrap": False}),
+    ("KS Ticker", {"width": 18}),
+    ("Cached", {"width": 12}),
+)
+
+# Compact arb layout: drop Spread and Days columns
+_ARB_COLS_MOBILE = (
+    ("Polymarket bracket", {"max_width": 20, "no_wrap": False}),
+    ("PM leg", {"width": 9, "justify": "center"}),
+    ("Kalshi bracket", {"max_width": 20, "no_wrap": False}),
+    ("KS leg", {"width": 9, "justify": "center"}),
+    ("Profit", {"width": 7, "justify": "right"}),
+    ("Ann.%", {"width": 7, "justify": "right"}),
+)
+_ARB_COLS_DESKTOP = (
+    ("Polymarket bracket", {"min_width": 28, "max_width": 44, "no_wrap": False}),
+    ("PM leg", {"width": 12, "justify": "center"}),
+    ("Kalshi bracket", {"min_width": 28, "max_width": 44, "no_wrap": False}),
+    ("KS leg", {"width": 12, "justify": "center"}),
+    ("Spread", {"width": 8, "justify": "right"}),
+    ("Profit", {"width": 7, "justify": "right"}),
+    ("Days", {"width": 5, "justify": "right"}),
+    ("Ann.%", {"width": 7, "justify": "right"}),
+)
+
+
+def _new_table(cols_mobile: tuple, cols_desktop: tuple, **kwargs):
+    """Table with the shared CLI styling and the column spec for the current layout."""
+    from rich import box
+    from rich.table import Table
+
+    kwargs.setdefault("box", box.SIMPLE if _mobile else box.ROUNDED)
+    kwargs.setdefault("header_style", "bold magenta")
+    table = Table(**kwargs)
+    for name, col_kwargs in cols_mobile if _mobile else cols_desktop:
+        table.add_column(name, **col_kwargs)
+    return table
+
+
 # ── list command ──────────────────────────────────────────────────────────────
 
 
@@ -108,6 +194,7 @@ def cmd_list(args: argparse.Namespace) -> None:
         return
 
     if args.group_by_category:
+        from comparator import group_by_category
         groups = group_by_category(events)
         for cat, cat_events in groups.items():
             _render_event_table(cat_events, title=f"[bold]{source.title()}[/bold] — {cat}")
@@ -118,36 +205,32 @@ def cmd_list(args: argparse.Namespace) -> None:
 
 
 def _render_event_table(events: list[NormalizedEvent], title: str) -> None:
-    table = Table(
+    from comparator import normalize_category
+
+    table = _new_table(
+        _EVENT_COLS_MOBILE, _EVENT_COLS_DESKTOP,
         title=title,
-        box=box.SIMPLE if _mobile else box.ROUNDED,
         show_lines=False,
-        header_style="bold magenta",
         title_style="bold white",
     )
+
+    # Format every row up front, then hand finished tuples to rich
+    link, fmt_volume = _link, _fmt_volume
     if _mobile:
-        table.add_column("Title", max_width=28, no_wrap=False)
-        table.add_column("Price", width=16)
-        table.add_column("Ends", width=10)
+        rows = [(link(e.title, e.url), e.top_price_display, e.end_date or "—") for e in events]
     else:
-        table.add_column("Title", min_width=30, max_width=55, no_wrap=False)
-        table.add_column("Category", width=14)
-        table.add_column("Top Market", width=22)
-        table.add_column("Volume", width=10, justify="right")
-        table.add_column("End Date", width=12)
-
-    for e in events:
-        title_cell = _link(e.title, e.url)
-        if _mobile:
-            table.add_row(title_cell, _top_market_price(e), e.end_date or "—")
-        else:
-            table.add_row(
-                title_cell,
+        rows = [
+            (
+                link(e.title, e.url),
                 normalize_category(e.category),
-                _top_market_price(e),
-                _fmt_volume(e.volume),
+                e.top_price_display,
+                fmt_volume(e.volume),
                 e.end_date or "—",
             )
+            for e in events
+        ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -156,23 +239,28 @@ def _render_event_table(events: list[NormalizedEvent], title: str) -> None:
 
 
 def _fetch_both(limit: int, category: str | None) -> tuple[list, list]:
+    """Fetch both platforms concurrently; wall time is the slower of the two."""
     from clients.polymarket import fetch_events as poly_fetch
     from clients.kalshi import fetch_events as kalshi_fetch
 
     poly_events: list[NormalizedEvent] = []
     kalshi_events: list[NormalizedEvent] = []
 
-    try:
-        poly_events = poly_fetch(limit=limit, category=category)
-        console.print(f"  [green]✓[/green] Polymarket: {len(poly_events)} events")
-    except RuntimeError as exc:
-        console.print(f"  [red]✗ Polymarket:[/red] {exc}")
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_poly = ex.submit(poly_fetch, limit=limit, category=category)
+        f_kalshi = ex.submit(kalshi_fetch, limit=limit, category=category)
 
-    try:
-        kalshi_events = kalshi_fetch(limit=limit, category=category)
-        console.print(f"  [green]✓[/green] Kalshi:     {len(kalshi_events)} events")
-    except RuntimeError as exc:
-        console.print(f"  [red]✗ Kalshi:[/red] {exc}")
+        try:
+            poly_events = f_poly.result()
+            console.print(f"  [green]✓[/green] Polymarket: {len(poly_events)} events")
+        except RuntimeError as exc:
+            console.print(f"  [red]✗ Polymarket:[/red] {exc}")
+
+        try:
+            kalshi_events = f_kalshi.result()
+            console.print(f"  [green]✓[/green] Kalshi:     {len(kalshi_events)} events")
+        except RuntimeError as exc:
+            console.print(f"  [red]✗ Kalshi:[/red] {exc}")
 
     return poly_events, kalshi_events
 
@@ -213,6 +301,8 @@ def _run_event_compare(
     min_score: float,
     use_embeddings: bool,
 ) -> None:
+    from matchers import default_matcher
+
     console.print(f"\n[bold]Comparing events[/bold] (min score: {min_score})…\n")
     matches = default_matcher().match_events(poly_events, kalshi_events, min_score)
 
@@ -224,8 +314,12 @@ def _run_event_compare(
 
     _render_event_match_table(matches)
 
-    matched_poly = {r.poly_event.id for r in matches}
-    matched_kalshi = {r.kalshi_event.id for r in matches}
+    matched_poly: set[str] = set()
+    matched_kalshi: set[str] = set()
+    add_poly, add_kalshi = matched_poly.add, matched_kalshi.add
+    for r in matches:
+        add_poly(r.poly_event.id)
+        add_kalshi(r.kalshi_event.id)
     console.print(
         f"\n[dim]Matched: {len(matches)} pairs | "
         f"Unmatched Polymarket: {len(poly_events) - len(matched_poly)} | "
@@ -234,38 +328,33 @@ def _run_event_compare(
 
 
 def _render_event_match_table(matches: list[MatchResult]) -> None:
-    table = Table(
+    table = _new_table(
+        _EVENT_MATCH_COLS_MOBILE, _EVENT_MATCH_COLS_DESKTOP,
         title="[bold]Matched Events[/bold]",
-        box=box.SIMPLE if _mobile else box.ROUNDED,
         show_lines=True,
-        header_style="bold magenta",
         title_style="bold white",
     )
+
+    link = _link
+    score_cells = [Text(_fmt_score(r.score), style=_score_color(r.score)) for r in matches]
     if _mobile:
-        table.add_column("Polymarket", max_width=24, no_wrap=False)
-        table.add_column("~", width=5, justify="center")
-        table.add_column("Kalshi", max_width=24, no_wrap=False)
+        rows = [
+            (link(r.poly_event.title, r.poly_event.url), sc, link(r.kalshi_event.title, r.kalshi_event.url))
+            for r, sc in zip(matches, score_cells)
+        ]
     else:
-        table.add_column("Polymarket", min_width=28, max_width=40, no_wrap=False)
-        table.add_column("PM Price", width=14, justify="center")
-        table.add_column("Score", width=7, justify="center")
-        table.add_column("Kalshi Price", width=14, justify="center")
-        table.add_column("Kalshi", min_width=28, max_width=40, no_wrap=False)
-
-    for r in matches:
-        pm_title = _link(r.poly_event.title, r.poly_event.url)
-        ks_title = _link(r.kalshi_event.title, r.kalshi_event.url)
-        score_cell = Text(_fmt_score(r.score), style=_score_color(r.score))
-        if _mobile:
-            table.add_row(pm_title, score_cell, ks_title)
-        else:
-            table.add_row(
-                pm_title,
-                _top_market_price(r.poly_event),
-                score_cell,
-                _top_market_price(r.kalshi_event),
-                ks_title,
+        rows = [
+            (
+                link(r.poly_event.title, r.poly_event.url),
+                r.poly_event.top_price_display,
+                sc,
+                r.kalshi_event.top_price_display,
+                link(r.kalshi_event.title, r.kalshi_event.url),
             )
+            for r, sc in zip(matches, score_cells)
+        ]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
     console.print("[dim]Score: cosine similarity 0.0–1.0 (green ≥0.92, yellow ≥0.85, red <0.85)[/dim]")
@@ -282,6 +371,8 @@ def _run_bracket_compare(
     use_embeddings: bool,
     refresh_cache: bool = False,
 ) -> None:
+    from comparator import find_market_matches
+
     mode = "semantic embeddings" if use_embeddings else "fuzzy matching"
     cache_note = " [dim](cache bypassed)[/dim]" if refresh_cache else ""
     console.print(
@@ -313,9 +404,29 @@ def _run_bracket_compare(
     _render_bracket_matches(pairs)
 
 
+def _bracket_row(r: MarketMatchResult, price_fn) -> tuple:
+    """Pre-formatted cells for one bracket-match row."""
+    return (
+        _link(r.poly_market.question, r.poly_market.url),
+        price_fn(r.poly_market),
+        Text(_fmt_score(r.score), style=_score_color(r.score)),
+        price_fn(r.kalshi_market),
+        _link(r.kalshi_market.display_question, r.kalshi_market.url),
+    )
+
+
 def _render_bracket_matches(
     pairs: list[tuple],  # list[tuple[MatchResult, list[MarketMatchResult]]]
 ) -> None:
+    from rich import box
+    from rich.console import Group
+    from rich.rule import Rule
+
+    price_fn = _fmt_price_pair_short if _mobile else fmt_price_pair
+    # Collect every rule/table and print them as one Group: one render pass, one flush.
+    # render_str() applies markup + highlighting exactly as console.print(str) would.
+    renderables: list = []
+
     for event_match, market_matches in pairs:
         pm_title = event_match.poly_event.title
         ks_title = event_match.kalshi_event.title
@@ -328,63 +439,36 @@ def _render_bracket_matches(
                 f"[bold cyan]{pm_title}[/bold cyan]  "
                 f"[dim]↔  {ks_title}  (event score: {event_score})[/dim]"
             )
-        console.print(Rule(header, style="dim cyan"))
+        renderables.append(Rule(header, style="dim cyan"))
 
         if not market_matches:
             pm_count = len(event_match.poly_event.markets)
             ks_count = len(event_match.kalshi_event.markets)
-            console.print(
+            renderables.append(console.render_str(
                 f"  [dim]No bracket matches above threshold "
                 f"(PM has {pm_count} sub-markets, Kalshi has {ks_count})[/dim]"
-            )
+            ))
             continue
 
-        table = Table(
+        table = _new_table(
+            _BRACKET_COLS_MOBILE, _BRACKET_COLS_DESKTOP,
             box=box.SIMPLE,
             show_header=True,
-            header_style="bold magenta",
             show_lines=False,
             padding=(0, 1),
         )
-        if _mobile:
-            table.add_column("Polymarket bracket", max_width=20, no_wrap=False)
-            table.add_column("PM", width=10, justify="center")
-            table.add_column("~", width=5, justify="center")
-            table.add_column("KS", width=10, justify="center")
-            table.add_column("Kalshi bracket", max_width=20, no_wrap=False)
-        else:
-            table.add_column("Polymarket bracket", min_width=32, max_width=50, no_wrap=False)
-            table.add_column("PM price", width=14, justify="center")
-            table.add_column("Score", width=7, justify="center")
-            table.add_column("Kalshi price", width=14, justify="center")
-            table.add_column("Kalshi bracket", min_width=32, max_width=50, no_wrap=False)
-
-        for r in sorted(market_matches, key=lambda x: x.score, reverse=True):
-            # Strip parent event prefix from Kalshi question for cleaner display
-            ks_q = r.kalshi_market.question
-            prefix = r.kalshi_market.parent_event_title + ": "
-            if ks_q.startswith(prefix):
-                ks_q = ks_q[len(prefix):]
-
-            pm_q_cell = _link(r.poly_market.question, r.poly_market.url)
-            ks_q_cell = _link(ks_q, r.kalshi_market.url)
-            score_cell = Text(_fmt_score(r.score), style=_score_color(r.score))
-            price_fn = _fmt_price_pair_short if _mobile else _fmt_price_pair
-
-            table.add_row(
-                pm_q_cell,
-                price_fn(r.poly_market),
-                score_cell,
-                price_fn(r.kalshi_market),
-                ks_q_cell,
-            )
 
-        console.print(table)
+        ranked = sorted(market_matches, key=_score_key, reverse=True)
+        for row in [_bracket_row(r, price_fn) for r in ranked]:
+            table.add_row(*row)
 
-    console.print(
+        renderables.append(table)
+
+    renderables.append(console.render_str(
         "\n[dim]Bracket score: cosine similarity "
         "(green ≥0.92, yellow ≥0.85, red <0.85)[/dim]"
-    )
+    ))
+    console.print(Group(*renderables))
 
 
 # ── cache command ─────────────────────────────────────────────────────────────
@@ -405,24 +489,11 @@ def cmd_cache(args: argparse.Namespace) -> None:
         if not pairs:
             console.print("[yellow]Cache is empty.[/yellow]")
             return
-        table = Table(
+        table = _new_table(
+            _CACHE_PAIR_COLS_MOBILE, _CACHE_PAIR_COLS_DESKTOP,
             title=f"[bold]Cached Event Pairs[/bold]  ({len(pairs)} total)",
-            box=box.SIMPLE if _mobile else box.ROUNDED,
             show_lines=True,
-            header_style="bold magenta",
         )
-        if _mobile:
-            table.add_column("Polymarket Event", max_width=24, no_wrap=False)
-            table.add_column("~", width=5, justify="center")
-            table.add_column("Kalshi Event", max_width=24, no_wrap=False)
-            table.add_column("Ticker", width=16)
-        else:
-            table.add_column("Polymarket Event", min_width=28, max_width=44, no_wrap=False)
-            table.add_column("PM ID", width=10)
-            table.add_column("Score", width=7, justify="center")
-            table.add_column("Kalshi Event", min_width=28, max_width=44, no_wrap=False)
-            table.add_column("KS Ticker", width=18)
-            table.add_column("Cached", width=12)
         for p in pairs:
             pm_cell = _link(p["pm_title"] or p["pm_event_id"], p.get("pm_url") or "")
             ks_cell = _link(p["ks_title"] or p["ks_event_ticker"], p.get("ks_url") or "")
@@ -458,6 +529,8 @@ def cmd_cache(args: argparse.Namespace) -> None:
 
 
 def cmd_arb(args: argparse.Namespace) -> None:
+    from comparator import find_market_matches, find_arbitrage
+
     limit: int = args.limit
     use_embeddings = not args.no_embeddings
     min_profit_frac = args.min_profit / 100.0  # CLI takes cents, internals use fraction
@@ -509,65 +582,45 @@ def cmd_arb(args: argparse.Namespace) -> None:
     _render_arb_table(arb_results)
 
 
+def _arb_row(r: ArbitrageResult) -> tuple:
+    """Pre-formatted cells for one arbitrage row (mobile or desktop layout)."""
+    pm = r.poly_market
+    ks = r.kalshi_market
+
+    if r.best_leg == "pm_yes_ks_no":
+        pm_leg = f"Y {fmt_price(pm.yes_price)}" if _mobile else f"Yes {fmt_price(pm.yes_price)}"
+        ks_leg = f"N {fmt_price(ks.no_price)}" if _mobile else f"No  {fmt_price(ks.no_price)}"
+    else:
+        pm_leg = f"N {fmt_price(pm.no_price)}" if _mobile else f"No  {fmt_price(pm.no_price)}"
+        ks_leg = f"Y {fmt_price(ks.yes_price)}" if _mobile else f"Yes {fmt_price(ks.yes_price)}"
+
+    profit_cents = r.profit * 100
+    profit_color = "green" if profit_cents >= 2.0 else "yellow" if profit_cents >= 0.5 else "white"
+    ann_str = f"{r.annualized_return * 100:.1f}%" if r.annualized_return is not None else "—"
+
+    pm_q_cell = _link(pm.question, pm.url)
+    ks_q_cell = _link(ks.display_question, ks.url)  # parent-title prefix already stripped
+    profit_cell = Text(fmt_price(r.profit), style=profit_color)
+
+    if _mobile:
+        return (pm_q_cell, pm_leg, ks_q_cell, ks_leg, profit_cell, ann_str)
+    days_str = str(r.days_to_resolution) if r.days_to_resolution is not None else "—"
+    return (
+        pm_q_cell, pm_leg, ks_q_cell, ks_leg,
+        fmt_price(r.spread), profit_cell, days_str, ann_str,
+    )
+
+
 def _render_arb_table(results: list[ArbitrageResult]) -> None:
-    table = Table(
+    table = _new_table(
+        _ARB_COLS_MOBILE, _ARB_COLS_DESKTOP,
         title="[bold]Arbitrage Opportunities[/bold]  [dim](sorted by annualized return)[/dim]",
-        box=box.SIMPLE if _mobile else box.ROUNDED,
         show_lines=True,
-        header_style="bold magenta",
         title_style="bold white",
     )
-    if _mobile:
-        # Compact layout: drop Spread and Days columns
-        table.add_column("Polymarket bracket", max_width=20, no_wrap=False)
-        table.add_column("PM leg", width=9, justify="center")
-        table.add_column("Kalshi bracket", max_width=20, no_wrap=False)
-        table.add_column("KS leg", width=9, justify="center")
-        table.add_column("Profit", width=7, justify="right")
-        table.add_column("Ann.%", width=7, justify="right")
-    else:
-        table.add_column("Polymarket bracket", min_width=28, max_width=44, no_wrap=False)
-        table.add_column("PM leg", width=12, justify="center")
-        table.add_column("Kalshi bracket", min_width=28, max_width=44, no_wrap=False)
-        table.add_column("KS leg", width=12, justify="center")
-        table.add_column("Spread", width=8, justify="right")
-        table.add_column("Profit", width=7, justify="right")
-        table.add_column("Days", width=5, justify="right")
-        table.add_column("Ann.%", width=7, justify="right")
-
-    for r in results:
-        pm = r.poly_market
-        ks = r.kalshi_market
-
-        if r.best_leg == "pm_yes_ks_no":
-            pm_leg = f"Y {_fmt_price(pm.yes_price)}" if _mobile else f"Yes {_fmt_price(pm.yes_price)}"
-            ks_leg = f"N {_fmt_price(ks.no_price)}" if _mobile else f"No  {_fmt_price(ks.no_price)}"
-        else:
-            pm_leg = f"N {_fmt_price(pm.no_price)}" if _mobile else f"No  {_fmt_price(pm.no_price)}"
-            ks_leg = f"Y {_fmt_price(ks.yes_price)}" if _mobile else f"Yes {_fmt_price(ks.yes_price)}"
-
-        profit_cents = r.profit * 100
-        profit_color = "green" if profit_cents >= 2.0 else "yellow" if profit_cents >= 0.5 else "white"
-        ann_str = f"{r.annualized_return * 100:.1f}%" if r.annualized_return is not None else "—"
-        days_str = str(r.days_to_resolution) if r.days_to_resolution is not None else "—"
-
-        # Strip Kalshi parent event prefix from question for cleaner display
-        ks_q = ks.question
-        prefix = ks.parent_event_title + ": "
-        if ks_q.startswith(prefix):
-            ks_q = ks_q[len(prefix):]
-
-        pm_q_cell = _link(pm.question, pm.url)
-        ks_q_cell = _link(ks_q, ks.url)
-        profit_cell = Text(f"{profit_cents:.1f}¢", style=profit_color)
-
-        if _mobile:
-            table.add_row(pm_q_cell, pm_leg, ks_q_cell, ks_leg, profit_cell, ann_str)
-        else:
-            table.add_row(
-                pm_q_cell, pm_leg, ks_q_cell, ks_leg,
-                f"{r.spread * 100:.1f}¢", profit_cell, days_str, ann_str,
-            )
+
+    for row in [_arb_row(r) for r in results]:
+        table.add_row(*row)
 
     console.print(table)
     console.print(
@@ -652,6 +705,14 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+COMMANDS = {
+    "list": cmd_list,
+    "compare": cmd_compare,
+    "arb": cmd_arb,
+    "cache": cmd_cache,
+}
+
+
 def main() -> None:
     global console, _mobile
 
@@ -669,14 +730,7 @@ def main() -> None:
         border_style="cyan",
     ))
 
-    if args.command == "list":
-        cmd_list(args)
-    elif args.command == "compare":
-        cmd_compare(args)
-    elif args.command == "arb":
-        cmd_arb(args)
-    elif args.command == "cache":
-        cmd_cache(args)
+    COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
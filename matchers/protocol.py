@@ -8,6 +8,10 @@ To add a new matcher:
 Scores on MatchResult / MarketMatchResult must always be normalised to [0, 1].
 The orchestration layer (comparator.find_market_matches) is matcher-agnostic;
 it handles caching, date pre-filtering, and the single-market shortcut.
+
+Matchers may also define prefetch_markets(market_lists); if present it is
+called once with every sub-market list that will reach match_markets(), so
+expensive per-text work can be batched across pairs.
 """
 
 from typing import Protocol, runtime_checkable
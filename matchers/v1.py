@@ -2,19 +2,73 @@
 V1 Matcher: GeminiFuzzyMatcher
   - Primary:  Gemini gemini-embedding-001 cosine similarity
   - Fallback: rapidfuzz token_sort_ratio (when no API key or embedding fails)
-  - Assignment: greedy best-first 1-to-1 from similarity matrix
+  - Assignment: optimal 1-to-1 (Hungarian, SciPy) from similarity matrix;
+                greedy best-first available via assignment="greedy"
 
 All scores are normalised to [0, 1] before being stored on results.
 """
 
-import re
+import string
 import numpy as np
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from models import NormalizedEvent, NormalizedMarket, MatchResult, MarketMatchResult
 
 
+_KEEP = frozenset(string.ascii_lowercase + string.digits + " ")
+
+
+class _CleanTable(dict):
+    """str.translate table: keep [a-z0-9 ], map every other code point to a space.
+
+    ASCII is filled up front; other code points are added on first sight, so
+    non-ASCII input is blanked just as a [^a-z0-9 ] substitution would.
+    """
+
+    def __missing__(self, code: int) -> int | str:
+        value = code if chr(code) in _KEEP else " "
+        self[code] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable({c: c if chr(c) in _KEEP else " " for c in range(128)})
+
+
 def _clean(text: str) -> str:
-    return re.sub(r"[^a-z0-9 ]", " ", text.lower()).strip()
+    return text.lower().translate(_CLEAN_TABLE).strip()
+
+
+def _exact_pairs(left_keys: list[str], right_keys: list[str]) -> list[tuple[int, int]]:
+    """
+    1-to-1 (i, j) index pairs whose cleaned texts are identical. Duplicate
+    keys pair off in input order; empty keys never match.
+    """
+    free: dict[str, list[int]] = {}
+    for j, key in enumerate(right_keys):
+        if key:
+            free.setdefault(key, []).append(j)
+    pairs = []
+    for i, key in enumerate(left_keys):
+        js = free.get(key)
+        if js:
+            pairs.append((i, js.pop(0)))
+    return pairs
+
+
+def _fuzzy_matrix(left: list[str], right: list[str], min_score: float) -> np.ndarray:
+    """
+    N×M token_sort_ratio matrix on the [0, 1] scale, computed in RapidFuzz's
+    multithreaded C++ cdist. Cells below min_score are returned as 0.
+    """
+    sim = process.cdist(
+        left, right,
+        scorer=fuzz.token_sort_ratio,
+        processor=None,
+        score_cutoff=min_score * 100,
+        dtype=np.float32,
+        workers=-1,
+    )
+    sim /= 100.0
+    return sim
 
 
 def _greedy_assign(left: list, right: list, sim: np.ndarray, min_score: float, make_result) -> list:
@@ -22,24 +76,75 @@ def _greedy_assign(left: list, right: list, sim: np.ndarray, min_score: float, m
     Generic greedy best-first 1-to-1 assignment.
     sim values and min_score must be on the same [0, 1] scale.
     """
-    results = []
-    used_left: set[int] = set()
-    used_right: set[int] = set()
+    picked: list[int] = []    # flat indices of assigned cells, best-first
+    n_left, n_right = sim.shape
+    used_left = bytearray(n_left)    # 0/1 flags, indexed by row / column
+    used_right = bytearray(n_right)
+
+    # Only cells at or above min_score can be assigned. At most
+    # min(n_left, n_right) pairs can be made, so rather than sorting every
+    # candidate, argpartition off the top `batch` scores (plus ties at the
+    # cut), sort only those, and fall back to the next, doubled batch if
+    # conflicts leave rows unassigned.
+    # Descending order; reversing a stable argsort over ascending flat indices
+    # breaks ties by higher (i, j) first, same as sorting (score, i, j) tuples.
+    flat = sim.ravel()
+    candidates = np.flatnonzero(flat >= min_score)
+    max_pairs = min(n_left, n_right)
+    batch = max_pairs
+    while candidates.size and len(picked) < max_pairs:
+        if candidates.size > batch:
+            scores = flat[candidates]
+            cut = np.partition(scores, scores.size - batch)[scores.size - batch]
+            take = scores >= cut
+            head, candidates = candidates[take], candidates[~take]
+        else:
+            head, candidates = candidates, candidates[:0]
+        order = head[np.argsort(flat[head], kind="stable")[::-1]]
+        for idx in order.tolist():
+            i, j = divmod(idx, n_right)
+            if used_left[i] or used_right[j]:
+                continue
+            picked.append(idx)
+            used_left[i] = 1
+            used_right[j] = 1
+            if len(picked) == max_pairs:
+                break
+        batch *= 2
+
+    # Round all kept scores in one pass (float64, matching round(float(x), 4))
+    scores = np.round(flat[picked].astype(np.float64), 4).tolist()
+    return [
+        make_result(left[idx // n_right], right[idx % n_right], score)
+        for idx, score in zip(picked, scores)
+    ]
 
-    pairs = sorted(
-        ((sim[i, j], i, j) for i in range(len(left)) for j in range(len(right))),
-        reverse=True,
-    )
-    for score, i, j in pairs:
-        if score < min_score:
-            break
-        if i in used_left or j in used_right:
-            continue
-        results.append(make_result(left[i], right[j], round(float(score), 4)))
-        used_left.add(i)
-        used_right.add(j)
 
-    return results
+def _optimal_assign(left: list, right: list, sim: np.ndarray, min_score: float, make_result) -> list:
+    """
+    Maximum-weight 1-to-1 assignment (Hungarian algorithm, SciPy) over the
+    cells with sim >= min_score. Below-threshold cells are zeroed so they can
+    never displace an eligible pair. Results are returned best-first, like
+    _greedy_assign. sim values and min_score must be on the same [0, 1] scale.
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    if sim.size == 0:
+        return []
+    eligible = np.where(sim >= min_score, sim, 0.0)
+    rows, cols = linear_sum_assignment(eligible, maximize=True)
+    keep = sim[rows, cols] >= min_score
+    rows, cols = rows[keep], cols[keep]
+    order = np.argsort(-sim[rows, cols], kind="stable")
+    rows, cols = rows[order], cols[order]
+    scores = np.round(sim[rows, cols].astype(np.float64), 4).tolist()
+    return [
+        make_result(left[i], right[j], score)
+        for i, j, score in zip(rows.tolist(), cols.tolist(), scores)
+    ]
+
+
+_ASSIGNERS = {"optimal": _optimal_assign, "greedy": _greedy_assign}
 
 
 class GeminiFuzzyMatcher:
@@ -49,8 +154,18 @@ class GeminiFuzzyMatcher:
     Attempts Gemini embedding-001 cosine similarity first; falls back to
     rapidfuzz token_sort_ratio if the API key is absent or a request fails.
     Fuzzy scores are divided by 100 so all stored scores are in [0, 1].
+
+    assignment="optimal" (default) picks the 1-to-1 pairing with the highest
+    total score; assignment="greedy" keeps the original best-first pass.
     """
 
+    def __init__(self, assignment: str = "optimal") -> None:
+        if assignment not in _ASSIGNERS:
+            raise ValueError(f"Unknown assignment strategy: {assignment!r}")
+        self._assign = _ASSIGNERS[assignment]
+        # id(market list) → (list, its rows of the batched question embeddings)
+        self._prefetched: dict[int, tuple[list[NormalizedMarket], np.ndarray]] = {}
+
     # ── Public protocol methods ───────────────────────────────────────────────
 
     def match_events(
@@ -59,8 +174,8 @@ class GeminiFuzzyMatcher:
         kalshi_events: list[NormalizedEvent],
         min_score: float,
     ) -> list[MatchResult]:
-        from config import GEMINI_API_KEY
-        if GEMINI_API_KEY:
+        from config import gemini_api_key
+        if gemini_api_key():
             try:
                 return self._events_semantic(poly_events, kalshi_events, min_score)
             except Exception as exc:
@@ -73,55 +188,109 @@ class GeminiFuzzyMatcher:
         kalshi_markets: list[NormalizedMarket],
         min_score: float,
     ) -> list[MarketMatchResult]:
-        from config import GEMINI_API_KEY
-        if GEMINI_API_KEY:
+        from config import gemini_api_key
+        if gemini_api_key():
             try:
                 return self._markets_semantic(poly_markets, kalshi_markets, min_score)
             except Exception as exc:
                 print(f"[yellow]Sub-market embedding failed ({exc}), using fuzzy.[/yellow]")
         return self._markets_fuzzy(poly_markets, kalshi_markets, min_score)
 
+    def prefetch_markets(self, market_lists: list[list[NormalizedMarket]]) -> None:
+        """
+        Optional hook called by find_market_matches before the per-pair loop.
+        Embeds every market question in one embed_texts() call and keeps each
+        list's slice of the result, so match_markets() on those same lists
+        skips embedding entirely.
+        """
+        self._prefetched = {}
+        from config import gemini_api_key
+        if not gemini_api_key():
+            return
+        questions = [m.question for ms in market_lists for m in ms]
+        if not questions:
+            return
+        try:
+            from clients.embeddings import embed_texts
+            vectors = embed_texts(questions)
+        except Exception as exc:
+            print(f"[yellow]Sub-market pre-embedding failed ({exc}), embedding per pair.[/yellow]")
+            return
+        offset = 0
+        for ms in market_lists:
+            self._prefetched[id(ms)] = (ms, vectors[offset : offset + len(ms)])
+            offset += len(ms)
+
     # ── Private helpers ───────────────────────────────────────────────────────
 
     def _events_semantic(self, poly_events, kalshi_events, min_score):
         from clients.embeddings import embed_texts, cosine_similarity_matrix
-        pv = embed_texts([e.title for e in poly_events])
-        kv = embed_texts([e.title for e in kalshi_events])
+
+        # Titles that are identical after cleaning match at 1.0 without embedding
+        exact = _exact_pairs(
+            [_clean(e.title) for e in poly_events],
+            [_clean(e.title) for e in kalshi_events],
+        )
+        results = [
+            MatchResult(poly_event=poly_events[i], kalshi_event=kalshi_events[j], score=1.0)
+            for i, j in exact
+        ]
+        used_poly = {i for i, _ in exact}
+        used_kalshi = {j for _, j in exact}
+        poly_rest = [e for i, e in enumerate(poly_events) if i not in used_poly]
+        kalshi_rest = [e for j, e in enumerate(kalshi_events) if j not in used_kalshi]
+        if not poly_rest or not kalshi_rest:
+            return results
+
+        pv = embed_texts([e.title for e in poly_rest])
+        kv = embed_texts([e.title for e in kalshi_rest])
         sim = cosine_similarity_matrix(pv, kv)
-        return _greedy_assign(
-            poly_events, kalshi_events, sim, min_score,
+        return results + self._assign(
+            poly_rest, kalshi_rest, sim, min_score,
             lambda pe, ke, s: MatchResult(poly_event=pe, kalshi_event=ke, score=s),
         )
 
     def _events_fuzzy(self, poly_events, kalshi_events, min_score):
         pc = [_clean(e.title) for e in poly_events]
         kc = [_clean(e.title) for e in kalshi_events]
-        sim = np.zeros((len(poly_events), len(kalshi_events)), dtype=np.float32)
-        for i, p in enumerate(pc):
-            for j, k in enumerate(kc):
-                sim[i, j] = fuzz.token_sort_ratio(p, k) / 100.0
-        return _greedy_assign(
+        sim = _fuzzy_matrix(pc, kc, min_score)
+        return self._assign(
             poly_events, kalshi_events, sim, min_score,
             lambda pe, ke, s: MatchResult(poly_event=pe, kalshi_event=ke, score=s),
         )
 
+    def _market_vectors(self, markets):
+        hit = self._prefetched.get(id(markets))
+        if hit is not None and hit[0] is markets:
+            return hit[1]
+        from clients.embeddings import embed_texts
+        return embed_texts([m.question for m in markets])
+
     def _markets_semantic(self, poly_markets, kalshi_markets, min_score):
-        from clients.embeddings import embed_texts, cosine_similarity_matrix
-        pv = embed_texts([m.question for m in poly_markets])
-        kv = embed_texts([m.question for m in kalshi_markets])
+        from clients.embeddings import cosine_similarity_matrix
+        pv = self._market_vectors(poly_markets)
+        kv = self._market_vectors(kalshi_markets)
         sim = cosine_similarity_matrix(pv, kv)
-        return _greedy_assign(
+        if sim.size and 1 in sim.shape:
+            # One market on either side: at most one pair, so the best cell
+            # is the whole assignment — skip the assignment step.
+            i, j = divmod(int(np.argmax(sim)), sim.shape[1])
+            score = float(sim[i, j])
+            if score < min_score:
+                return []
+            return [MarketMatchResult(
+                poly_market=poly_markets[i], kalshi_market=kalshi_markets[j], score=round(score, 4),
+            )]
+        return self._assign(
             poly_markets, kalshi_markets, sim, min_score,
             lambda pm, km, s: MarketMatchResult(poly_market=pm, kalshi_market=km, score=s),
         )
 
     def _markets_fuzzy(self, poly_markets, kalshi_markets, min_score):
-        sim = np.zeros((len(poly_markets), len(kalshi_markets)), dtype=np.float32)
-        for i, pm in enumerate(poly_markets):
-            pc = _clean(pm.question)
-            for j, km in enumerate(kalshi_markets):
-                sim[i, j] = fuzz.token_sort_ratio(pc, _clean(km.question)) / 100.0
-        return _greedy_assign(
+        pc = [_clean(m.question) for m in poly_markets]
+        kc = [_clean(m.question) for m in kalshi_markets]
+        sim = _fuzzy_matrix(pc, kc, min_score)
+        return self._assign(
             poly_markets, kalshi_markets, sim, min_score,
             lambda pm, km, s: MarketMatchResult(poly_market=pm, kalshi_market=km, score=s),
         )
@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class NormalizedMarket:
     question: str          # Full sub-market question (embedding-ready)
     yes_price: float       # probability 0.0 - 1.0
@@ -14,9 +14,28 @@ class NormalizedMarket:
     parent_event_title: str = ""
     close_time: str = ""            # ISO date "YYYY-MM-DD" when market resolves
     url: str = ""                   # Direct link to this market/bracket
+    display_question: str = ""      # question minus the "parent_event_title: " prefix
 
 
-@dataclass
+# Every 0.1¢ tick from 0¢ to 100¢, pre-formatted. Prices that sit on a tick
+# (all API prices with ≤3 decimals) become a tuple index; anything else
+# (half-ticks, out-of-range) falls back to format().
+_CENT_TABLE: tuple[str, ...] = tuple(f"{i / 10:.1f}¢" for i in range(1001))
+
+
+def fmt_price(price: float) -> str:
+    mills = price * 1000
+    i = round(mills)
+    if 0 <= i <= 1000 and abs(mills - i) < 1e-6:
+        return _CENT_TABLE[i]
+    return f"{price * 100:.1f}¢"
+
+
+def fmt_price_pair(m: NormalizedMarket) -> str:
+    return f"Yes {fmt_price(m.yes_price)} / No {fmt_price(m.no_price)}"
+
+
+@dataclass(slots=True)
 class NormalizedEvent:
     source: str        # "polymarket" or "kalshi"
     id: str
@@ -27,9 +46,10 @@ class NormalizedEvent:
     end_date: str
     url: str
     markets: list = field(default_factory=list)  # list[NormalizedMarket]
+    top_price_display: str = "—"    # fmt_price_pair(markets[0]), set by the client
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     """Event-level match (legacy)."""
     poly_event: NormalizedEvent
@@ -37,7 +57,7 @@ class MatchResult:
     score: float       # 0-100 fuzzy or 0.0-1.0 cosine
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketMatchResult:
     """Sub-market / bracket level match."""
     poly_market: NormalizedMarket
@@ -45,7 +65,7 @@ class MarketMatchResult:
     score: float       # cosine similarity 0.0-1.0 or fuzzy 0-100
 
 
-@dataclass
+@dataclass(slots=True)
 class ArbitrageResult:
     """A cross-platform arbitrage opportunity from a matched bracket pair."""
     poly_market: NormalizedMarket
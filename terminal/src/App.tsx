@@ -45,7 +45,9 @@ export default function App() {
       const cmd = pendingCmdRef.current
 
       if (msg.type === 'progress') {
-        useStore.getState().setProgressMsg(msg.msg as string)
+        // Server batches bursts of progress messages; show the latest one
+        const msgs = msg.msgs as string[]
+        useStore.getState().setProgressMsg(msgs[msgs.length - 1])
       } else if (msg.type === 'done') {
         const state = useStore.getState()
         state.setLoading(false)
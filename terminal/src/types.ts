@@ -9,6 +9,7 @@ export interface NormalizedMarket {
   parent_event_title: string
   close_time: string
   url: string
+  display_question: string
 }
 
 export interface NormalizedEvent {
@@ -21,6 +22,7 @@ export interface NormalizedEvent {
   end_date: string
   url: string
   markets: NormalizedMarket[]
+  top_price_display: string
 }
 
 export interface MatchResult {